@@ -17,6 +17,7 @@ __version__ = "0.5.0"
 del division, print_function, unicode_literals
 
 import ast
+import heapq
 import numpy as np
 import cma
 from cma import interfaces
@@ -25,7 +26,12 @@ from moarchiving import BiobjectiveNondominatedSortedList
 import warnings
 import cma.utilities.utils
 import os
+import weakref
 from .sofomore_logger import SofomoreDataLogger
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 
 class Sofomore(interfaces.OOOptimizer):
@@ -88,6 +94,15 @@ class Sofomore(interfaces.OOOptimizer):
             integer as input and returns a random number between 0 and 1.
             It is used as a `key value` in: `sorted(..., key = ...)`, and guides the
             order in which the kernels will be updated during the optimization.
+            - 'n_workers': default value is 1. If larger than 1, the `ask` and
+            `tell` methods of the kernels are called in parallel in a pool of
+            `n_workers` processes, when several kernels are asked at once
+            (`tell` only when `restart` is `None`).
+            The kernels are pickled back and forth, hence this only pays off
+            when their updates are expensive, e.g. in large dimension.
+            The processes are released with `close_process_pool`.
+            The kernels must sample with a picklable ``'randn'`` option which
+            uses the global random state, like the kernels from `get_cmas`.
  
 
     `reference_point`  
@@ -132,7 +147,15 @@ class Sofomore(interfaces.OOOptimizer):
         ...  # `tell` updates the MO instance by passing the respective function values.
         ...     moes.disp() # display data on the evolution of the optimization 
     
-    One iteration of the `optimize` interface is equivalent to one step in the 
+    When evaluating `fitness` is expensive, all solutions of an iteration
+    can be evaluated in parallel with ``moes.optimize(fitness, n_jobs=4)``,
+    or with ``cma.optimization_tools.EvalParallel2(fitness, 4)`` in the
+    `ask-and-tell` loop. The processes are created once and reused in all
+    iterations. This requires `fitness` to be picklable, hence the single
+    objectives of `FitFun` must then be defined with ``def`` at module
+    level instead of with ``lambda``.
+
+    One iteration of the `optimize` interface is equivalent to one step in the
     loop of the `ask-and-tell` interface. But for the latter, the prototyper has
     more controls to analyse and guide the optimization, due to the access of 
     the instance between the `ask` and the `tell` calls.
@@ -199,10 +222,11 @@ class Sofomore(interfaces.OOOptimizer):
             - The reference_point is set by the user during the 
             initialization.
             - `opts` is a dictionary updating the values of 'indicator_front',
-            'archive', 'restart', 'update_order'; that respond respectfully to
-            the changing fitness we will choose within an iteration of Sofomore,
-            whether or not keeping an archive, how to do the restart in case of
-            any restart, and the order of update of the kernels. It also has
+            'archive', 'restart', 'update_order', 'n_workers'; that respond
+            respectfully to the changing fitness we will choose within an
+            iteration of Sofomore, whether or not keeping an archive, how to do
+            the restart in case of any restart, the order of update of the
+            kernels, and the number of processes to update them. It also has
             the keys 'verb_filename', 'verb_log' and 'verb_disp'; that 
             respectfully indicate the name of the filename containing the Sofomore
             data, the logging of the Sofomore data every 'verb_log' iterations
@@ -212,15 +236,21 @@ class Sofomore(interfaces.OOOptimizer):
         assert len(list_of_solvers_instances) > 0
         self.kernels = list_of_solvers_instances
         self.dimension = self.kernels[0].N
-        self._active_indices = list(range(len(self)))
 
         for kernel in self.kernels:
             if not hasattr(kernel, 'objective_values'):
                 kernel.objective_values = None
+            # values told to another instance, maybe for another problem,
+            # must not prevent the evaluation of the incumbent in `ask`
+            kernel._objective_values_incumbent = None
+        # `stop` relies on `_active_indices` containing only non-stopped kernels
+        self._active_indices = [idx for idx in range(len(self)) if \
+                                not self.kernels[idx].stop()]
         self.reference_point = reference_point
         defopts = {'archive': True, 'restart': None, 'verb_filename': 'outsofomore' + os.sep, 
                    'verb_log': 1, 'verb_disp': 100, 'update_order': sort_random,
-                   'indicator_front': None  # 'archive' or any attribute containing a list of f-pairs
+                   'indicator_front': None,  # 'archive' or any attribute containing a list of f-pairs
+                   'n_workers': 1,  # number of processes for the kernels' ask and tell
                    }
         if opts is None:
             opts = {}
@@ -254,9 +284,17 @@ class Sofomore(interfaces.OOOptimizer):
                                                      modulo=self.opts['verb_log']).register(self)
         self.best_hypervolume_pareto_front = 0.0
         self.epsilon_hypervolume_pareto_front = 0.1 # the minimum positive convergence gap
-        self._ratio_nondom_offspring_incumbent = len(self) * [0]
+        self._ratio_nondom_offspring_incumbent = np.zeros(len(self))  # written by the logger
         
         self._last_stopped_kernel_id = None
+        self._pareto_front_cut_cache = None  # (reference_point, NDA, set of tuples)
+        self._obj_matrix = None  # kernels' objective values, set in the first `tell`
+        self._median_kernel_stats_cache = None  # (countiter, medians) pair
+        self._process_pool_executor = None  # created when needed, see `n_workers` option
+        self._process_pool_finalizer = None  # shuts the pool down, see `close_process_pool`
+        self._kernel_index = {id(kernel): i for i, kernel in enumerate(self.kernels)}
+        self._stop_cache = None  # (countiter, result of `stop`) pair
+        self._log_kernels = all(_has_logger(kernel) for kernel in self.kernels)
 
     def __iter__(self):
         """
@@ -344,9 +382,27 @@ class Sofomore(interfaces.OOOptimizer):
                 return float('-inf')
             return self._UHVI_indicator(kernel)(kernel.objective_values)
         if key is None:
+            if (self.reference_point is not None
+                    and self.NDA is BiobjectiveNondominatedSortedList):
+                # all UHVIs in a single pass instead of one archive per kernel
+                uhvis = _uhvi_leave_one_out_2d(self._obj_matrix,
+                                               self.reference_point)
+                # a stable argsort keeps the order of `sorted` for equal values
+                return [self.kernels[i] for i in
+                        np.argsort(-uhvis if reverse else uhvis, kind='stable')]
             key = hv_improvement
         return sorted(self, key=key, reverse=reverse, **kwargs)
 
+    @staticmethod
+    def _objective_values_array(kernels, num_objectives):
+        """return the objective values of `kernels` as `float` array of shape
+        ``(len(kernels), num_objectives)``, with `nan` for kernels without
+        objective values.
+        """
+        return np.array([k.objective_values if k.objective_values is not None
+                         else num_objectives * [np.nan] for k in kernels],
+                        dtype=float).reshape(len(kernels), num_objectives)
+
     def ask(self, number_to_ask=1):
         """
         get the kernels' incumbents to be evaluated and sample new candidate solutions from 
@@ -354,7 +410,9 @@ class Sofomore(interfaces.OOOptimizer):
         The sampling is done by calling the `ask` method of the
         `cma.CMAEvolutionStrategy` class.
         The indices of the considered kernels' incumbents are given by the 
-        `_told_indices` attribute.
+        `_told_indices` attribute. Incumbents which have not changed since
+        their objective values were told, like that of a copied kernel
+        added on restart, are not evaluated again.
         
         To get the `number_to_ask` kernels, we use the function `self.key_sort_indices` as
         a key to sort `self._remaining_indices_to_ask` (which is the list of
@@ -396,8 +454,19 @@ class Sofomore(interfaces.OOOptimizer):
             warnings.warn("value larger than the number of active kernels {}. ".format(
                     len(self._active_indices)) + "Set to {}.".format(len(self._active_indices)))
         self.offspring = []
+        self._told_indices = [i for i in self._told_indices
+                              if not _has_incumbent_values(self.kernels[i])]
         res = [self.kernels[i].incumbent for i in self._told_indices]
         indices_to_ask = self._indices_to_ask(number_to_ask)
+        if self.opts['n_workers'] > 1 and len(indices_to_ask) > 1:
+            # the seeds make the sampling (only) depend on the global random state
+            seeds = np.random.randint(2**31 - 1, size=len(indices_to_ask))
+            for ikernel, (kernel, offspring) in zip(indices_to_ask, self._process_pool().map(
+                    _kernel_ask, [self.kernels[i] for i in indices_to_ask], seeds)):
+                self.kernels[ikernel] = kernel
+                res.extend(offspring)
+                self.offspring += [(ikernel, offspring)]
+            return res
         for ikernel in indices_to_ask:
             kernel = self.kernels[ikernel]
             offspring = kernel.ask()
@@ -429,6 +498,11 @@ class Sofomore(interfaces.OOOptimizer):
         To update a kernel, `tell()` applies the kernel's `tell` method
         to the kernel's corresponding candidate solutions (offspring) along
         with the "changing" fitness `- self.indicator_front.hypervolume_improvement`.
+        Without `restart`, the fitnesses of all kernels are computed with
+        the same front before any kernel is updated, possibly in parallel
+        (see the `n_workers` option). With `restart`, each kernel is updated
+        before the fitness of the next kernel is computed, hence a kernel
+        added on restart is in the front of the kernels updated after it.
         
         :See: 
             - the `tell` method from the class `cma.CMAEvolutionStrategy`,
@@ -444,20 +518,64 @@ class Sofomore(interfaces.OOOptimizer):
             self.NDA = BiobjectiveNondominatedSortedList if len(
                     objective_values[0]) == 2 else NonDominatedList
         
-        objective_values = np.asarray(objective_values).tolist()
+        # the values are staged once as array, the offspring's values are views
+        objective_array = np.asarray(objective_values, dtype=float)
+        objective_values = objective_array.tolist()
+        # offspring with nan or infinite objective values get the worst f-value
+        infeasible = ~np.isfinite(objective_array).all(axis=1)
+        if self._obj_matrix is None:
+            self._obj_matrix = self._objective_values_array(self.kernels,
+                                                            len(objective_values[0]))
 
         for i in range(len(self._told_indices)):
-            self.kernels[self._told_indices[i]].objective_values = objective_values[i]
-        
-        if self.reference_point is None:
-            pass #write here the max among the kernel.objective_values       
-            
+            kernel = self.kernels[self._told_indices[i]]
+            kernel.objective_values = objective_values[i]
+            kernel._objective_values_incumbent = np.asarray(kernel.incumbent).tobytes()
+        self._obj_matrix[self._told_indices] = objective_array[:len(self._told_indices)]
+        self._pareto_front_cut_cache = None
+
+        # used throughout instead of a `None` reference point
+        reference_point = self._concrete_reference_point(objective_array)
+
         start = len(self._told_indices) # position of the first offspring
         self._told_indices = []
+
+        # In the default bi-objective case, the empirical front of the
+        # incumbents is computed once with numpy and the front without
+        # the kernel being updated is derived from it.
+        F = None
+        if (self.indicator_front.list_attribute is None
+                and self.NDA is BiobjectiveNondominatedSortedList
+                and self.indicator_front.NDA is BiobjectiveNondominatedSortedList):
+            F = self._obj_matrix
+            on_front = _front_2d(F, reference_point)
+            front = _sorted_front_2d(F, on_front)
+        elif self.indicator_front.list_attribute:
+            # the front doesn't depend on the kernel and changes only after the loop
+            self.indicator_front.set_kernel(None, self, lazy=False,
+                                            reference_point=reference_point)
+
+        # With restarts, each kernel is updated before the f-values of the
+        # next kernel are computed, such that the front of the later kernels
+        # contains the kernels added on restart.
+        interleaved = self.restart is not None
+        updates = []  # (ikernel, offspring, penalized f-values, objective values)
         for ikernel, offspring in self.offspring:
-            self.indicator_front.set_kernel(self[ikernel], self)  # use reference_point and list_attribute
-            hypervolume_improvements = [self.indicator_front.hypervolume_improvement(point)
-                                            for point in objective_values[start:start+len(offspring)]]
+            if F is None:
+                if not self.indicator_front.list_attribute:
+                    # not lazy, the same kernel may be updated again with another front
+                    self.indicator_front.set_kernel(self[ikernel], self, lazy=False,
+                                                    reference_point=reference_point)
+                hypervolume_improvements = self.indicator_front.hypervolume_improvements(
+                    objective_array[start:start+len(offspring)])
+            else:
+                front_observed = front
+                if on_front[ikernel]:  # otherwise removing ikernel doesn't change the front
+                    front_observed = _front_without_2d(F, ikernel, front,
+                                                       reference_point)
+                hypervolume_improvements = _uhvi_2d(
+                    objective_array[start:start+len(offspring)],
+                    front_observed, reference_point)
             kernel = self.kernels[ikernel]
             if kernel.fit.median0 is not None and kernel.fit.median0 >= 0:
                 # make sure the median reference comes from the right side of the empirical front
@@ -468,29 +586,29 @@ class Sofomore(interfaces.OOOptimizer):
                 #   if self.indicator_front.hypervolume_improvement(kernel.objective_values) <= 0:  # kernel.fit.median0 >= 0 is the same
                 #       kernel.stop(reset='tolfunrel')  # to be implemented
                 kernel.fit.median0 = None
-            kernel.tell(offspring, [-float(u) for u in hypervolume_improvements])
-            
-            # investigate whether `kernel` hits its stopping criteria
-            if kernel.stop():
-                self._active_indices.remove(ikernel) # ikernel must be in `_active_indices`
-                self._last_stopped_kernel_id = ikernel
-                
-                if self.restart is not None:
-                    kernel_to_add = self.restart(self)
-                    self._told_indices += [len(self)]
-                    self.add(kernel_to_add)
-
-            try:
-                kernel.logger.add()
-            except:
-                pass
-            kernel._last_offspring_f_values = objective_values[start:start+len(offspring)]
-            
+            f_values = -np.asarray(hypervolume_improvements, dtype=float)
+            f_values[infeasible[start:start+len(offspring)]] = np.inf
+            updates += [(ikernel, offspring, f_values.tolist(),
+                         objective_values[start:start+len(offspring)])]
             start += len(offspring)
+            if interleaved and self._tell_kernel(*updates.pop()) and F is not None:
+                F = self._obj_matrix  # a kernel was added
+                on_front = _front_2d(F, reference_point)
+                front = _sorted_front_2d(F, on_front)
+
+        parallel = self.opts['n_workers'] > 1 and len(updates) > 1
+        if parallel:
+            for (ikernel, _, _, _), kernel in zip(updates, self._process_pool().map(
+                    _kernel_tell, *zip(*[(self.kernels[ikernel], offspring, f_values)
+                                         for ikernel, offspring, f_values, _ in updates]))):
+                self.kernels[ikernel] = kernel
+
+        for update in updates:
+            self._tell_kernel(*update, told=parallel)
             
         self._told_indices += [u for (u,v) in self.offspring]
         
-        current_hypervolume = self.pareto_front_cut.hypervolume
+        current_hypervolume = self._pareto_front_cut_stats(reference_point)[0]
         epsilon = abs(current_hypervolume - self.best_hypervolume_pareto_front)
         if epsilon:
             self.epsilon_hypervolume_pareto_front = min(self.epsilon_hypervolume_pareto_front, 
@@ -499,13 +617,48 @@ class Sofomore(interfaces.OOOptimizer):
                                                  current_hypervolume)
 
         if self.isarchive:
+            archive_candidates = objective_values
+            if self.NDA is BiobjectiveNondominatedSortedList:
+                # dominated values can't enter the archive, only insert the others
+                on_front = _front_2d(objective_array, self.reference_point)
+                if self.archive:
+                    on_front[on_front] = ~_dominated_by_front_2d(
+                        objective_array[on_front], np.asarray(self.archive, dtype=float))
+                archive_candidates = objective_array[on_front].tolist()
             if not self.archive:
-                self.archive = self.NDA(objective_values, self.reference_point)
+                self.archive = self.NDA(archive_candidates, self.reference_point)
             else:
-                self.archive.add_list(objective_values)
+                self.archive.add_list(archive_candidates)
         self.countiter += 1
         self.countevals += len(objective_values)
 
+
+    def _tell_kernel(self, ikernel, offspring, f_values, offspring_f_values, told=False):
+        """update kernel `ikernel` with `f_values` unless it was already
+        `told`, and handle its termination and restart.
+
+        Return whether a kernel was added on restart.
+        """
+        kernel = self.kernels[ikernel]
+        if not told:
+            kernel.tell(offspring, f_values)
+
+        added = False
+        # investigate whether `kernel` hits its stopping criteria
+        if kernel.stop():
+            self._active_indices.remove(ikernel) # ikernel must be in `_active_indices`
+            self._last_stopped_kernel_id = ikernel
+            
+            if self.restart is not None:
+                kernel_to_add = self.restart(self)
+                self._told_indices += [len(self)]
+                self.add(kernel_to_add)
+                added = True
+
+        if self._log_kernels:
+            kernel.logger.add()
+        kernel._last_offspring_f_values = offspring_f_values
+        return added
         
     @property
     def pareto_front_cut(self):
@@ -513,10 +666,77 @@ class Sofomore(interfaces.OOOptimizer):
         return the non-dominated solutions dominating the reference point,
         among the kernels' objective values.
         It's the image of `self.pareto_set_cut`.
+
+        The returned archive is a new copy of the archive cached in
+        `_cached_pareto_front_cut`, hence it can be modified.
+        """
+        front = self._cached_pareto_front_cut()[0]
+        return type(front)([list(f) for f in front], self.reference_point)
+
+    def _cached_pareto_front_cut(self):
+        """return `pareto_front_cut` and the `set` of its points as tuples.
+
+        The archive is cached until the kernels or their objective values
+        change in `tell`, `add`, `remove` or `inactivate`, or until the
+        reference point changes. It must not be modified.
+        """
+        reference_point = (None if self.reference_point is None
+                           else list(self.reference_point))
+        if (self._pareto_front_cut_cache is None
+                or self._pareto_front_cut_cache[0] != reference_point):
+            F = self._obj_matrix
+            NDA = self.NDA  # `None` before the first `tell`
+            if NDA is None:
+                NDA = (NonDominatedList if reference_point is not None
+                       and len(reference_point) != 2 else BiobjectiveNondominatedSortedList)
+            front = NDA([] if F is None else F[~np.isnan(F).any(axis=1)].tolist(),
+                        self.reference_point)
+            self._pareto_front_cut_cache = (reference_point, front,
+                                            set(tuple(f) for f in front))
+        return self._pareto_front_cut_cache[1:]
+
+    def _pareto_front_2d_np(self):
+        """return ``(fx, fy, mask)`` where the kernels with ``mask == True``
+        form the bi-objective `pareto_front_cut`, with sorted first and
+        second objective values `fx` and `fy`.
+
+        Unlike `pareto_front_cut`, no archive is created.
+        """
+        mask = _front_2d(self._obj_matrix, self.reference_point)
+        front = _sorted_front_2d(self._obj_matrix, mask)
+        return front[:, 0], front[:, 1], mask
+
+    def _pareto_front_cut_stats(self, reference_point=None):
+        """return the hypervolume and the number of points of
+        `pareto_front_cut`, in the bi-objective case without creating the
+        archive and with the hypervolume as `float`.
+
+        The hypervolume is computed with respect to `reference_point`,
+        by default ``self._concrete_reference_point()``.
         """
-        return self.NDA([kernel.objective_values for kernel in self.kernels \
-                         if kernel.objective_values is not None],
-                         self.reference_point)
+        if reference_point is None:
+            reference_point = self._concrete_reference_point()
+        if self.NDA is BiobjectiveNondominatedSortedList and self._obj_matrix is not None:
+            fx, fy, _ = self._pareto_front_2d_np()
+            return float(np.sum(np.diff(np.append(fx, reference_point[0])) *
+                                (reference_point[1] - fy))), len(fx)
+        front = self._cached_pareto_front_cut()[0]
+        if self.reference_point is None and reference_point is not None:
+            front = self.NDA(list(front), reference_point)
+        return front.hypervolume, len(front)
+
+    def _concrete_reference_point(self, F=None):
+        """return `self.reference_point` or, if it is `None`, a point which
+        is dominated by all kernels' objective values and by the rows of `F`.
+        """
+        if self.reference_point is not None:
+            return self.reference_point
+        values = [v for v in (self._obj_matrix, F) if v is not None and len(v)]
+        values = np.vstack(values) if values else np.zeros((0, 0))
+        values = values[np.isfinite(values).all(axis=1)]
+        if not len(values):
+            return None
+        return (values.max(axis=0) + 1).tolist()
 
     @property
     def pareto_set_cut(self):
@@ -525,8 +745,20 @@ class Sofomore(interfaces.OOOptimizer):
         reference point, among the kernels' incumbents.
         It's the pre-image of `self.pareto_front_cut`.
         """
+        if self.NDA is BiobjectiveNondominatedSortedList and self._obj_matrix is not None:
+            # the kernels whose objective values equal a front point, found
+            # with a binary search of all rows of `_obj_matrix` at once
+            fx, fy, _ = self._pareto_front_2d_np()
+            if not len(fx):
+                return []
+            F = self._obj_matrix
+            j = np.minimum(np.searchsorted(fx, F[:, 0]), len(fx) - 1)
+            on_front = (fx[j] == F[:, 0]) & (fy[j] == F[:, 1])
+            return [self.kernels[i].incumbent for i in np.nonzero(on_front)[0]]
+        on_front = self._cached_pareto_front_cut()[1]
         return [kernel.incumbent for kernel in self.kernels if \
-                kernel.objective_values in self.pareto_front_cut]
+                kernel.objective_values is not None and
+                tuple(kernel.objective_values) in on_front]
 
     @property
     def pareto_front_uncut(self):
@@ -541,11 +773,9 @@ class Sofomore(interfaces.OOOptimizer):
                         if k.objective_values is not None]
         # TODO: this should preferably all be done in self.NDA
         def reference(f_pairs):
-            reference = []
-            for i in [0, 1]:  # make a reference that is dominated by all f_pairs
-                reference[i] = max(f[i] for f in f_pairs)
-                reference[i] = 1.1**np.sign(reference[i]) * reference[i] + 1
-            return reference
+            # make a reference that is dominated by all f_pairs
+            reference = np.max(np.asarray(f_pairs, dtype=float), axis=0)
+            return (1.1**np.sign(reference) * reference + 1).tolist()
         if not f_pairs:
             if self.reference_point in (None, (), [], {}):  # should never happen
                 warnings.warn("Sofomore.pareto_front_uncut: self.reference_point = %s"
@@ -571,14 +801,22 @@ class Sofomore(interfaces.OOOptimizer):
              4: dict4},
         where each index `i` is a key which value is the `dict` instance
         `self.kernels[i].stop()`
+
+        The stopped kernels are removed from the active kernels in `tell`
+        and `inactivate`, hence with active kernels `False` is returned
+        right away. Otherwise, the result is cached until the next `tell`.
         """
-        res = {}
-        for i in range(len(self)):
-            if self.kernels[i].stop():
+        if self._active_indices:
+            return False
+        if self._stop_cache is None or self._stop_cache[0] != self.countiter:
+            res = {}
+            for i in range(len(self)):
                 res[i] = self.kernels[i].stop()
-            else:
-                return False
-        return res
+                if not res[i]:
+                    res = False
+                    break
+            self._stop_cache = (self.countiter, res)
+        return self._stop_cache[1]
             
     @property 
     def termination_status(self):
@@ -599,11 +837,21 @@ class Sofomore(interfaces.OOOptimizer):
         """
         if not isinstance(kernels, list):
             kernels = [kernels]
+        self._kernel_index.update((id(kernel), len(self.kernels) + i)
+                                  for i, kernel in enumerate(kernels))
         self.kernels += kernels
+        self._log_kernels = self._log_kernels and all(_has_logger(kernel) for kernel in kernels)
+        if self._obj_matrix is not None:
+            self._obj_matrix = np.vstack([self._obj_matrix,
+                self._objective_values_array(kernels, self._obj_matrix.shape[1])])
         # update `_active_indices` from scratch: inactive kernels might be added
         self._active_indices = [idx for idx in range(len(self)) if \
                                 not self.kernels[idx].stop()]
-        self._ratio_nondom_offspring_incumbent = len(self) * [0] # len(self) changed
+        self._ratio_nondom_offspring_incumbent = np.append(  # len(self) changed
+            self._ratio_nondom_offspring_incumbent, np.zeros(len(kernels)))
+        self._pareto_front_cut_cache = None
+        self._median_kernel_stats_cache = None
+        self._stop_cache = None
         
     def remove(self, kernels):
         """
@@ -613,60 +861,86 @@ class Sofomore(interfaces.OOOptimizer):
         """
         if not isinstance(kernels, list):
             kernels = [kernels]
-        for kernel in kernels:
-            if kernel in self.kernels:
-                self.kernels.remove(kernel)
+        indices = set(self._index_of(kernel) for kernel in kernels) - {None}
+        if indices:
+            if self._obj_matrix is not None:
+                self._obj_matrix = np.delete(self._obj_matrix, list(indices), axis=0)
+            self._ratio_nondom_offspring_incumbent = np.delete(
+                self._ratio_nondom_offspring_incumbent, list(indices))
+            self.kernels = [kernel for i, kernel in enumerate(self.kernels)
+                            if i not in indices]
+            self._kernel_index = {id(kernel): i for i, kernel in enumerate(self.kernels)}
+            self._log_kernels = all(_has_logger(kernel) for kernel in self.kernels)
 
         self._active_indices = [idx for idx in range(len(self)) if \
                                 not self.kernels[idx].stop()]
+        self._pareto_front_cut_cache = None
+        self._median_kernel_stats_cache = None
+        self._stop_cache = None
+
+    def _kernel_stds(self):
+        """return the array of shape ``(len(self), self.dimension)`` of the
+        kernels' coordinate-wise ``sigma * max(sigma_vec * pc, sigma_vec * dC**0.5) / sigma0``.
+        """
+        return np.array([_cached_stds(kernel)[1] for kernel in self.kernels], dtype=float)
 
     @property
     def median_stds(self):
         """
         """
-        tab = []
-        res = []
-        for kernel in self.kernels:
-            conv = np.sqrt(kernel.dC)
-            vec = []
-            for i in range(len(kernel.pc)):
-                xi = max(kernel.sigma_vec*kernel.pc[i], kernel.sigma_vec*conv[i])
-                vec += [kernel.sigma * xi / kernel.sigma0]
-            tab += [sorted(vec)]
-        for i in range(len(tab[0])):
-            vec = [u[i] for u in tab]
-            res += [np.median(vec)]
-        return res
+        return np.median(np.sort(self._kernel_stds(), axis=1), axis=0).tolist()
 
     @property
     def max_max_stds(self):
         """
         """
-        res = 0.0
-        for kernel in self.kernels:
-            conv = np.sqrt(kernel.dC)
-            vec = []
-            for i in range(len(kernel.pc)):
-                xi = max(kernel.sigma_vec*kernel.pc[i], kernel.sigma_vec*conv[i])
-                vec += [kernel.sigma * xi / kernel.sigma0]
-            res = max(res, max(vec))
-        return res    
+        return max(0.0, float(self._kernel_stds().max()))
     
+    def _sorted_indices(self, indices):
+        """return `indices` sorted with `self.key_sort_indices` as key.
+
+        With `sort_random` as key, this is a single random permutation.
+        """
+        if self.key_sort_indices is sort_random:
+            return [indices[i] for i in np.random.permutation(len(indices))]
+        if self.key_sort_indices in _vectorized_sort_keys:
+            # a stable argsort of all keys at once, the same order as `sorted`
+            indices = np.asarray(indices, dtype=int)
+            return indices[np.argsort(self.key_sort_indices(indices), kind='stable')].tolist()
+        return sorted(indices, key = self.key_sort_indices)
+
+    def _first_sorted_indices(self, indices, number):
+        """return the first `number` elements of ``self._sorted_indices(indices)``
+        and the remaining elements, in any order.
+
+        Only the first elements are sorted, with `heapq.nsmallest`. With
+        `sort_random` as key, a single random permutation is split (like in
+        ``np.random.choice(..., replace=False)``).
+        """
+        if self.key_sort_indices is sort_random:
+            permutation = np.random.permutation(len(indices))
+            return ([indices[i] for i in permutation[:number]],
+                    [indices[i] for i in permutation[number:]])
+        if self.key_sort_indices in _vectorized_sort_keys:
+            first = self._sorted_indices(indices)[:number]
+        else:
+            first = heapq.nsmallest(number, indices, key = self.key_sort_indices)
+        first_set = set(first)
+        return first, [i for i in indices if i not in first_set]
+
     def _indices_to_ask(self, number_to_ask):
         """
         """
-        sorted_indices = sorted(self._remaining_indices_to_ask, key = self.key_sort_indices)
         indices_to_ask = []
         remaining_indices = []
-        if number_to_ask <= len(sorted_indices):
-            indices_to_ask = sorted_indices[:number_to_ask]
-            remaining_indices = sorted_indices[number_to_ask:]
+        if number_to_ask <= len(self._remaining_indices_to_ask):
+            indices_to_ask, remaining_indices = self._first_sorted_indices(
+                self._remaining_indices_to_ask, number_to_ask)
         else:
-            val = number_to_ask - len(sorted_indices)
-            indices_to_ask = sorted_indices
-            sorted_indices = sorted(self._active_indices, key = self.key_sort_indices)
-            indices_to_ask += sorted_indices[:val]
-            remaining_indices = sorted_indices[val:]
+            val = number_to_ask - len(self._remaining_indices_to_ask)
+            indices_to_ask = self._sorted_indices(self._remaining_indices_to_ask)
+            first, remaining_indices = self._first_sorted_indices(self._active_indices, val)
+            indices_to_ask += first
         
         self._remaining_indices_to_ask = remaining_indices
         return indices_to_ask
@@ -680,8 +954,9 @@ class Sofomore(interfaces.OOOptimizer):
         might still play a role, due to its eventual trace in `self.pareto_front_cut`.
     
         """
-        if kernel in self.kernels:
-            ikernel = self.kernels.index(kernel)
+        ikernel = kernel if isinstance(kernel, (int, np.integer)) else self._index_of(kernel)
+        self._pareto_front_cut_cache = None
+        self._stop_cache = None
 
         try:
             self._active_indices.remove(ikernel)
@@ -700,14 +975,81 @@ class Sofomore(interfaces.OOOptimizer):
         kernel.stop() = {'callback': ['kernel turned off']}
         """
         raise NotImplementedError
-        if kernel in self.kernels:
-            ikernel = self.kernels.index(kernel)
+        ikernel = self._index_of(kernel)
         new_list = [callback for callback in self.kernels[ikernel].opts['termination_callback']\
                 if callback(kernel) == 'kernel turned off']
         kernel.opts['termination_callback'] = new_list
         if not kernel.stop():
             self._active_indices += [ikernel]
 
+    def _index_of(self, kernel):
+        """return the index of `kernel` in `self.kernels`, or `None` if
+        it is not an element, with a dictionary lookup.
+        """
+        i = self._kernel_index.get(id(kernel))
+        if i is None or i >= len(self.kernels) or self.kernels[i] is not kernel:
+            # `self.kernels` was changed from outside, like in the parallel `ask`
+            self._kernel_index = {id(k): i for i, k in enumerate(self.kernels)}
+            i = self._kernel_index.get(id(kernel))
+        return i
+
+    def __getstate__(self):
+        """the process pool is not pickled, a new one is created when needed"""
+        state = dict(self.__dict__)
+        state['_process_pool_executor'] = None
+        state['_process_pool_finalizer'] = None
+        return state
+
+    def _process_pool(self):
+        """return the pool of ``self.opts['n_workers']`` processes in which
+        the kernels are updated in parallel.
+
+        The pool is shut down with `close_process_pool` or when `self` is
+        garbage collected.
+        """
+        if self._process_pool_executor is None:
+            import concurrent.futures  # not needed in the serial case
+            self._process_pool_executor = concurrent.futures.ProcessPoolExecutor(
+                self.opts['n_workers'])
+            if hasattr(weakref, 'finalize'):  # not in Python 2
+                self._process_pool_finalizer = weakref.finalize(
+                    self, self._process_pool_executor.shutdown)
+        return self._process_pool_executor
+
+    def close_process_pool(self):
+        """shut down the worker processes of the `n_workers` option, if any.
+
+        A new pool is created when the kernels are again updated in parallel.
+        """
+        if self._process_pool_finalizer is not None:
+            self._process_pool_finalizer()  # calls `shutdown` only once
+        elif self._process_pool_executor is not None:
+            self._process_pool_executor.shutdown()
+        self._process_pool_executor = None
+        self._process_pool_finalizer = None
+
+    def _median_kernel_stats(self):
+        """return the medians over the kernels of the axis ratio, the
+        step-size, and the minimal and maximal standard deviation.
+
+        Used in `disp` and in the logger, the values are computed only once
+        per iteration.
+        """
+        if (self._median_kernel_stats_cache is None
+                or self._median_kernel_stats_cache[0] != self.countiter):
+            stats = np.empty((len(self), 4))  # filled in a single pass over the kernels
+            for i, kernel in enumerate(self.kernels):
+                if not kernel.opts['CMA_diagonal'] or kernel.countiter > kernel.opts['CMA_diagonal']:
+                    stats[i, 0] = kernel.D.max() / kernel.D.min()
+                else:
+                    stats[i, 0] = np.max(kernel.sigma_vec*1) / np.min(kernel.sigma_vec*1)
+                scaled_sqrt_dC = _cached_stds(kernel)[0]
+                stats[i, 1:] = (kernel.sigma, kernel.sigma * np.min(scaled_sqrt_dC),
+                                kernel.sigma * np.max(scaled_sqrt_dC))
+            self._median_kernel_stats_cache = (self.countiter,
+                                               tuple(np.median(stats, axis=0)))
+        return self._median_kernel_stats_cache[1]
+
     # The following methods 'disp_annotation' and 'disp' are from the 'cma'
     # module
     def disp_annotation(self):
@@ -741,18 +1083,15 @@ class Sofomore(interfaces.OOOptimizer):
             if self.countiter > 0 and (self.stop() or self.countiter < 4
                               or self.countiter % modulo < 1):
                 try:
+                    (median_axis_ratios, median_sigmas, median_min_stds,
+                     median_max_stds) = self._median_kernel_stats()
                     print(' '.join((repr(self.countiter).rjust(5),
                                     repr(self.countevals).rjust(6),
-                                    '%.15e' % (self.pareto_front_cut.hypervolume),
-                                    '%4.1e' % (np.median([kernel.D.max() / kernel.D.min()
-                                               if not kernel.opts['CMA_diagonal'] or kernel.countiter > kernel.opts['CMA_diagonal']
-                                               else max(kernel.sigma_vec*1) / min(kernel.sigma_vec*1) \
-                                               for kernel in self.kernels])),
-                                    '%6.2e' % (np.median([kernel.sigma for kernel in self.kernels])),
-                                    '%6.0e' % (np.median([kernel.sigma * min(kernel.sigma_vec * kernel.dC**0.5) \
-                                                         for kernel in self.kernels])),
-                                    '%6.0e' % (np.median([kernel.sigma * max(kernel.sigma_vec * kernel.dC**0.5) \
-                                                          for kernel in self.kernels]))
+                                    '%.15e' % (self._pareto_front_cut_stats()[0]),
+                                    '%4.1e' % median_axis_ratios,
+                                    '%6.2e' % median_sigmas,
+                                    '%6.0e' % median_min_stds,
+                                    '%6.0e' % median_max_stds
                                     )))
                 except AttributeError:
                     pass
@@ -803,25 +1142,386 @@ class IndicatorFront:
     def hypervolume_improvement(self, point):
         return self.front.hypervolume_improvement(point)
 
-    def set_kernel(self, kernel, moes, lazy=True):
+    def hypervolume_improvements(self, points):
+        """return the `hypervolume_improvement` of all `points` as a list.
+
+        For a `BiobjectiveNondominatedSortedList` front, whose points are
+        sorted, all values are computed in a single `hvi_sweep`.
+        """
+        if (isinstance(self.front, BiobjectiveNondominatedSortedList)
+                and self.front.reference_point is not None):
+            front = np.asarray(self.front, dtype=float).reshape(-1, 2)
+            return hvi_sweep(points, front[:, 0], front[:, 1],
+                             self.front.reference_point).tolist()
+        return [self.front.hypervolume_improvement(point) for point in points]
+
+    def set_kernel(self, kernel, moes, lazy=True, reference_point=None):
         """Set empirical front for evolving the given kernel.
         
         By default, make changes only when kernel has changed.
         
-        Details: ``moes.reference_point`` and, in case, its attribute
-        with name `self.list_attribute: str` is used.
+        Details: `reference_point`, by default ``moes.reference_point``, and,
+        in case, the attribute of `moes` with name
+        `self.list_attribute: str` is used.
         """
         if lazy and kernel == self.kernel:
             return
+        if reference_point is None:
+            reference_point = moes.reference_point
         if self.list_attribute:
             self.front = self.NDA(getattr(moes, self.list_attribute),
-                                  moes.reference_point)
+                                  reference_point)
         else:
             self.front = self.NDA([k.objective_values for k in moes if k != kernel],
-                                  moes.reference_point)
+                                  reference_point)
         self.kernel = kernel
 
+def _cached_stds(kernel):
+    """return the coordinate-wise ``sigma_vec * dC**0.5`` and
+    ``sigma * max(sigma_vec * pc, sigma_vec * dC**0.5) / sigma0`` of `kernel`.
+
+    The arrays are stored on `kernel` and recomputed only when its
+    `countiter` changed. They should not be modified.
+    """
+    cache = getattr(kernel, '_stds_cache', None)
+    if cache is None or cache[0] != kernel.countiter:
+        scaled_sqrt_dC = kernel.sigma_vec * np.sqrt(kernel.dC)
+        stds = kernel.sigma * np.maximum(kernel.sigma_vec * kernel.pc,
+                                         scaled_sqrt_dC) / kernel.sigma0
+        cache = kernel._stds_cache = (kernel.countiter, scaled_sqrt_dC, stds)
+    return cache[1:]
+
+def _has_incumbent_values(kernel):
+    """return whether the `objective_values` of `kernel` were told for its
+    current incumbent, such that the incumbent needs not be evaluated again.
+
+    The incumbent, not the mean, is compared, because kernels with the same
+    mean but different bounds have different incumbents.
+    """
+    return (kernel.objective_values is not None and
+            getattr(kernel, '_objective_values_incumbent', None) ==
+            np.asarray(kernel.incumbent).tobytes())
+
+def _has_logger(kernel):
+    """return whether `kernel` has a ``logger.add`` method, called in `Sofomore.tell`"""
+    return hasattr(getattr(kernel, 'logger', None), 'add')
+
+def _kernel_ask(kernel, seed):
+    """return `kernel` and the result of ``kernel.ask()`` sampled with `seed`,
+    used in the worker processes of `Sofomore.ask`.
+    """
+    np.random.seed(seed)
+    return kernel, kernel.ask()
+
+def _kernel_tell(kernel, offspring, f_values):
+    """return `kernel` after ``kernel.tell(offspring, f_values)``, used in
+    the worker processes of `Sofomore.tell`.
+    """
+    kernel.tell(offspring, f_values)
+    return kernel
+
+def _front_2d(F, reference_point=None):
+    """return a boolean mask of the rows of `F` which are on the empirical front.
+
+    `F` is an array of bi-objective values of shape ``(n, 2)``. Like in
+    `BiobjectiveNondominatedSortedList`, only one of several equal rows is
+    kept and, when `reference_point` is given, rows which do not strictly
+    dominate it are discarded. Rows containing `nan` or infinite values are
+    never on the front.
+
+    The front is found with a single lexicographic sort and a cumulative
+    minimum over the second objective::
+
+        >>> import numpy as np
+        >>> from comocma.como import _front_2d
+        >>> F = np.array([[1, 2], [2, 1], [2, 2], [1, 2], [0, 3], [3, 0]])
+        >>> _front_2d(F).tolist()
+        [True, True, False, False, True, True]
+        >>> _front_2d(F, [2.5, 2.5]).tolist()
+        [True, True, False, False, False, False]
+
+    """
+    F = np.asarray(F, dtype=float)
+    on_front = np.zeros(len(F), dtype=bool)
+    candidates = np.isfinite(F).all(axis=1)
+    if reference_point is not None:
+        candidates &= (F < np.asarray(reference_point, dtype=float)).all(axis=1)
+    candidates = np.nonzero(candidates)[0]
+    if len(candidates) == 0:
+        return on_front
+    order = candidates[np.lexsort((F[candidates, 1], F[candidates, 0]))]
+    f2 = F[order, 1]
+    on_front[order[0]] = True
+    on_front[order[1:]] = f2[1:] < np.minimum.accumulate(f2)[:-1]
+    return on_front
+
+def _dominated_by_front_2d(points, front):
+    """return a boolean mask of the `points` which are weakly dominated by
+    a point of the sorted bi-objective `front`, found by binary search.
+
+        >>> import numpy as np
+        >>> from comocma.como import _dominated_by_front_2d
+        >>> front = np.array([[1, 4], [2, 2], [3, 1.]])
+        >>> _dominated_by_front_2d([[2, 2], [2.5, 3], [1.5, 3], [0, 9], [4, 0]], front).tolist()
+        [True, True, False, False, False]
+
+    """
+    P = np.asarray(points, dtype=float).reshape(-1, 2)
+    front = np.asarray(front, dtype=float).reshape(-1, 2)
+    if len(front) == 0:
+        return np.zeros(len(P), dtype=bool)
+    j = np.searchsorted(front[:, 0], P[:, 0], side='right') - 1  # front point left of P
+    return (j >= 0) & (front[np.maximum(j, 0), 1] <= P[:, 1])
+
+def _sorted_front_2d(F, on_front):
+    """return the rows of `F` selected by the mask `on_front` sorted by the
+    first objective, as an array of shape ``(sum(on_front), 2)``.
+    """
+    front = np.asarray(F, dtype=float)[on_front]
+    return front[np.argsort(front[:, 0])]
+
+def _front_without_2d(F, i, front, reference_point):
+    """return the sorted empirical front of the rows of `F` except row `i`.
+
+    `front` is the sorted empirical front of all rows of `F`, as returned
+    by `_sorted_front_2d`, and ``F[i]`` must be one of its points. The
+    point is removed from `front` and replaced by the front of the rows
+    which only ``F[i]`` dominates, which are all found in the rectangle
+    between ``F[i]`` and its two neighbors::
+
+        >>> import numpy as np
+        >>> from comocma.como import _front_2d, _sorted_front_2d, _front_without_2d
+        >>> F = np.array([[1, 4], [2, 2], [3, 1], [2.5, 3], [2.5, 2.5], [2, 2]])
+        >>> front = _sorted_front_2d(F, _front_2d(F, [5, 5]))
+        >>> _front_without_2d(F, 1, front, [5, 5]).tolist()  # a copy remains
+        [[1.0, 4.0], [2.0, 2.0], [3.0, 1.0]]
+        >>> _front_without_2d(F[:5], 1, front, [5, 5]).tolist()
+        [[1.0, 4.0], [2.5, 2.5], [3.0, 1.0]]
+
+    """
+    F = np.asarray(F, dtype=float)
+    j = np.searchsorted(front[:, 0], F[i, 0])
+    upper_x = front[j + 1, 0] if j + 1 < len(front) else reference_point[0]
+    upper_y = front[j - 1, 1] if j > 0 else reference_point[1]
+    in_rectangle = (F >= F[i]).all(axis=1) & (F[:, 0] < upper_x) & (F[:, 1] < upper_y)
+    in_rectangle[i] = False
+    G = F[in_rectangle]
+    return np.concatenate([front[:j], _sorted_front_2d(G, _front_2d(G)), front[j + 1:]])
+
+def _uhvi_leave_one_out_2d(F, reference_point):
+    """return for each row of `F` its uncrowded hypervolume improvement
+    with respect to the empirical front of all other rows.
+
+    Rows containing `nan` get ``-inf``. On-front rows whose exclusive
+    rectangle contains no other row get their hypervolume contribution
+    in closed form, all other rows are evaluated with `_uhvi_2d`.
+
+        >>> import numpy as np
+        >>> from moarchiving import BiobjectiveNondominatedSortedList as NDA
+        >>> from comocma.como import _uhvi_leave_one_out_2d
+        >>> F, ref = np.array([[1, 4], [2, 2], [3, 1], [2, 2], [3, 3.]]), [5, 5]
+        >>> _uhvi_leave_one_out_2d(F, ref).tolist()
+        [1.0, 0.0, 2.0, 0.0, -1.0]
+        >>> F = 6 * np.random.rand(30, 2)
+        >>> assert np.allclose(_uhvi_leave_one_out_2d(F, ref),
+        ...     [float(NDA(np.delete(F, i, 0), ref).hypervolume_improvement(list(F[i])))
+        ...      for i in range(len(F))])
+
+    """
+    F = np.asarray(F, dtype=float)
+    uhvis = np.full(len(F), -np.inf)
+    valid = ~np.isnan(F).any(axis=1)
+    on_front = _front_2d(F, reference_point)
+    front = _sorted_front_2d(F, on_front)
+    dominated = valid & ~on_front
+    uhvis[dominated] = _uhvi_2d(F[dominated], front, reference_point)
+    # bounds of the rectangles only dominated by the respective front point
+    idx = np.nonzero(on_front)[0][np.argsort(F[on_front, 0])]
+    upper_x = np.append(front[1:, 0], reference_point[0])
+    upper_y = np.insert(front[:-1, 1], 0, reference_point[1])
+    uhvis[idx] = (upper_x - front[:, 0]) * (upper_y - front[:, 1])
+    # when other rows are in the rectangle, the front without the point differs
+    G = F[dominated]
+    in_rectangle = ((G[:, None, 0] >= front[:, 0]) & (G[:, None, 1] >= front[:, 1]) &
+                    (G[:, None, 0] < upper_x) & (G[:, None, 1] < upper_y))
+    for j in np.nonzero(in_rectangle.any(axis=0))[0]:
+        uhvis[idx[j]] = _uhvi_2d(F[idx[j]], _front_without_2d(F, idx[j], front, reference_point),
+                                 reference_point)[0]
+    return uhvis
+
+def _uhvi_2d(points, front, reference_point):
+    """return the uncrowded hypervolume improvements of `points` as an array.
+
+    `front` is a sorted array of non-dominated bi-objective values which
+    all dominate `reference_point`, as returned by `_sorted_front_2d`.
+    The values are the same (up to rounding) as
+    ``BiobjectiveNondominatedSortedList(front, reference_point).hypervolume_improvement(point)``
+    for each point: the hypervolume improvement if positive and otherwise
+    the negative distance to the empirical front in the reference domain.
+
+        >>> import numpy as np
+        >>> from moarchiving import BiobjectiveNondominatedSortedList as NDA
+        >>> from comocma.como import _uhvi_2d
+        >>> front, ref = [[1, 4], [2, 2], [3, 1]], [5, 5]
+        >>> _uhvi_2d([[2, 2], [3, 3], [0.5, 4.5], [6, 0.5]], front, ref).tolist()
+        [0.0, -1.0, 0.25, -1.0]
+        >>> points = 6 * np.random.rand(20, 2)
+        >>> nda = NDA(front, ref)
+        >>> assert np.allclose(_uhvi_2d(points, front, ref),
+        ...                    [float(nda.hypervolume_improvement(p)) for p in points.tolist()])
+
+    The values are computed with `_hvi_batch_2d` when `numba` is
+    installed, with `hvi_sweep` for large inputs, and otherwise all points
+    are processed at once against all stair steps of the front, given by
+    ``[x_{i-1}, x_i) x [0, y_{i-1})`` (with ``x_{-1} = -inf``, ``x_n = ref_x``
+    and ``y_{-1} = ref_y``) whose upper corners are the kink points used
+    for the distances.
+    """
+    P = np.asarray(points, dtype=float).reshape(-1, 2)
+    front = np.asarray(front, dtype=float).reshape(-1, 2)
+    if njit is not None:
+        return _hvi_batch_2d(np.ascontiguousarray(P), np.ascontiguousarray(front),
+                             float(reference_point[0]), float(reference_point[1]))
+    if len(P) * len(front) > 10000:  # the sweep has more overhead but scales better
+        return hvi_sweep(P, front[:, 0], front[:, 1], reference_point)
+    kink_x = np.append(front[:, 0], reference_point[0])
+    kink_y = np.insert(front[:, 1], 0, reference_point[1])
+    dx = P[:, :1] - kink_x  # shape (len(P), len(front) + 1)
+    dy = P[:, 1:] - kink_y
+    distances = np.sqrt(np.min(np.maximum(dx, 0)**2 + np.maximum(dy, 0)**2, axis=1))
+    widths = kink_x - np.maximum(np.insert(front[:, 0], 0, -np.inf), P[:, :1])
+    improvements = np.sum(np.maximum(widths, 0) * np.maximum(-dy, 0), axis=1)
+    return np.where(distances > 0, -distances, improvements)
+
+def hvi_sweep(points, front_x, front_y, ref):
+    """return the uncrowded hypervolume improvements of all `points` with
+    respect to the bi-objective front given by `front_x` and `front_y`.
+
+    `front_x` must be increasing, `front_y` decreasing and all front points
+    must dominate `ref`, like the points of a
+    `BiobjectiveNondominatedSortedList` with reference point `ref`.
+
+        >>> import numpy as np
+        >>> from comocma.como import hvi_sweep
+        >>> hvi_sweep([[2, 2], [3, 3], [0.5, 4.5], [6, 0.5]], [1, 2, 3], [4, 2, 1], [5, 5]).tolist()
+        [0.0, -1.0, 0.25, -1.0]
+        >>> hvi_sweep([[2, 2], [6, 5]], [], [], [5, 5]).tolist()
+        [9.0, -1.0]
+
+    The position of each point in the staircase of the front is found
+    by sorting, in `np.searchsorted`, the points against the front, once
+    by the first and once by the second objective. The hypervolume
+    improvement of a point is then the difference of two values of the
+    cumulated area under the staircase minus a rectangle, in O(1). The
+    distance of a dominated point to the front is the smallest distance
+    to the kink points which are dominated by the point, or to the two
+    kink points next to them.
+    """
+    P = np.asarray(points, dtype=float).reshape(-1, 2)
+    front_x = np.asarray(front_x, dtype=float)
+    front_y = np.asarray(front_y, dtype=float)
+    n = len(front_x)
+    p0, p1 = P[:, 0], P[:, 1]
+    kink_x = np.append(front_x, ref[0])  # the n + 1 upper corners of the stair steps
+    kink_y = np.insert(front_y, 0, ref[1])
+    a = np.searchsorted(front_x, p0, side='right')  # number of kinks with kink_x <= p0
+    k = np.searchsorted(-front_y, -p1)  # number of front points with y > p1
+    b = np.where(p1 < ref[1], k + 1, k)  # number of kinks with kink_y > p1
+    # area under the staircase from front_x[0], and at the front points
+    cumulated = np.insert(np.cumsum(front_y[:-1] * np.diff(front_x)), 0, 0.)
+    def area(x, j):  # area under the staircase from front_x[0] to x, front_x[j-1] <= x
+        if n == 0:
+            return (x - ref[0]) * ref[1]
+        i = np.maximum(j - 1, 0)
+        return np.where(j > 0, cumulated[i] + front_y[i] * (x - front_x[i]),
+                        (x - front_x[0]) * ref[1])
+    upper = kink_x[k]  # where the staircase steps below p1
+    improvements = np.where(
+        (upper > p0) & (p1 < ref[1]),
+        area(upper, np.where(k < n, k + 1, n)) - area(p0, a) - p1 * (upper - p0), 0.)
+    res = improvements.copy()
+    dominated = np.nonzero(improvements <= 0)[0]
+    if len(dominated) == 0:
+        return res
+    def distances(i, idx):
+        dx = np.maximum(p0[idx] - kink_x[i], 0)
+        dy = np.maximum(p1[idx] - kink_y[i], 0)
+        return np.sqrt(dx**2 + dy**2)
+    a, b = a[dominated], b[dominated]
+    d = np.minimum(distances(np.minimum(a, n), dominated), distances(np.maximum(b - 1, 0), dominated))
+    deep = np.nonzero(b < a)[0]  # these points dominate the kinks b, ..., a - 1
+    if len(deep):
+        i = np.arange(n + 1)
+        in_range = (i >= b[deep, None]) & (i < a[deep, None])
+        d_deep = np.where(in_range, distances(i, dominated[deep, None]), np.inf)
+        d[deep] = np.minimum(d[deep], d_deep.min(axis=1))
+    res[dominated] = np.where(d > 0, -d, 0.)
+    return res
+
+def _hvi_batch_2d(points, front, ref_x, ref_y):
+    """loop version of `hvi_sweep`, compiled with `numba` when it is installed.
+
+    For each point, a binary search into `front` finds the stair step
+    containing the point, from where the improvement is summed up until the
+    steps are below the point. Only points without improvement need a pass
+    over all kink points to get their distance.
+
+        >>> import numpy as np
+        >>> from comocma.como import _hvi_batch_2d, hvi_sweep
+        >>> front = np.array([[1, 4], [2, 2], [3, 1.]])
+        >>> points = 6 * np.random.rand(20, 2)
+        >>> assert np.allclose(_hvi_batch_2d(points, front, 5., 5.),
+        ...                    hvi_sweep(points, front[:, 0], front[:, 1], [5, 5]))
+
+    """
+    n = len(front)
+    res = np.empty(len(points))
+    for k in range(len(points)):
+        p0, p1 = points[k, 0], points[k, 1]
+        lo, hi = 0, n  # number of front points with first objective <= p0
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if front[mid, 0] <= p0:
+                lo = mid + 1
+            else:
+                hi = mid
+        improvement = 0.0
+        for i in range(lo, n + 1):
+            x = front[i, 0] if i < n else ref_x
+            y = front[i - 1, 1] if i > 0 else ref_y
+            if y <= p1:
+                break
+            left = front[i - 1, 0] if i > 0 and front[i - 1, 0] > p0 else p0
+            if x > left:
+                improvement += (x - left) * (y - p1)
+        if improvement > 0:
+            res[k] = improvement
+            continue
+        d2 = np.inf
+        for i in range(n + 1):
+            dx = p0 - (front[i, 0] if i < n else ref_x)
+            dy = p1 - (front[i - 1, 1] if i > 0 else ref_y)
+            d2 = min(d2, max(dx, 0.0)**2 + max(dy, 0.0)**2)
+        res[k] = -d2**0.5 if d2 > 0 else 0.0
+    return res
+
+if njit is not None:
+    _hvi_batch_2d = njit(cache=True)(_hvi_batch_2d)
+
+def _randn_global(*args):
+    """return ``np.random.randn(*args)``, the default ``'randn'`` option of
+    the kernels created with `get_cmas`.
+
+    Unlike `np.random.randn`, which is bound to the global random state,
+    the function is pickled by reference. Hence a kernel sent to or from
+    a worker process (see the `n_workers` option of `Sofomore`) samples
+    from the global random state of the process it is in, rather than from
+    a copy of the random state taken when it was pickled.
+    """
+    return np.random.randn(*args)
+
 cma_kernel_default_options_replacements = {
+        'randn': _randn_global,
         'conditioncov_alleviate': [np.inf, np.inf],
         'verbose': -1,
         'tolx': 1e-4,
@@ -866,11 +1566,11 @@ def get_cmas(x_starts, sigma_starts, inopts=None, number_created_kernels=0):
     if x_starts is not None and len(x_starts):
         try:
             x_starts = x_starts.tolist()
-        except:
+        except AttributeError:
             pass
         try:
             x_starts = [u.tolist() for u in x_starts]
-        except:
+        except AttributeError:
             pass
         if not isinstance(x_starts[0], list):
             x_starts = [x_starts]
@@ -898,9 +1598,11 @@ def get_cmas(x_starts, sigma_starts, inopts=None, number_created_kernels=0):
         except KeyError:
             pass
     
+    # the default options are created once and copied for each kernel
+    kernel_defopts = cma.CMAOptions()
+    kernel_defopts.update(cma_kernel_default_options_replacements)
     for i in range(num_kernels):
-        defopts = cma.CMAOptions()
-        defopts.update(cma_kernel_default_options_replacements)        
+        defopts = cma.CMAOptions(kernel_defopts)
         if isinstance(list_of_opts[i], dict):
             defopts.update(list_of_opts[i])
         defopts.update({'verb_filenameprefix': 'cma_kernels' + os.sep + 
@@ -945,6 +1647,9 @@ class CmaKernel(cma.CMAEvolutionStrategy):
         cma.CMAEvolutionStrategy.__init__(self, x0, sigma0, inopts)
         self.objective_values = None # the objective value of self's incumbent
         # (see below for definition of incumbent)
+        self._objective_values_incumbent = None # `incumbent.tobytes()` when `objective_values` was set
+        self._incumbent_mean_key = None # `mean.tobytes()` of the cached incumbent
+        self._cached_incumbent = None
         self._last_offspring_f_values = None # the fvalues of its offspring
         # used in the last call of `tell`.  
     
@@ -953,8 +1658,15 @@ class CmaKernel(cma.CMAEvolutionStrategy):
         """
         it gives the 'repaired' mean of a cma-es. For a problem with bound
         constraints, `self.incumbent` in inside the bounds.
+
+        The repaired mean is cached until the mean changes, a copy of it
+        is returned.
         """
-        return self.boundary_handler.repair(self.mean)
+        key = np.asarray(self.mean).tobytes()
+        if key != getattr(self, '_incumbent_mean_key', None):
+            self._cached_incumbent = self.boundary_handler.repair(self.mean)
+            self._incumbent_mean_key = key
+        return self._cached_incumbent.copy()
     
     def _copy_light(self, sigma=None, inopts=None):
         """tentative copy of self, versatile (interface and functionalities may change).
@@ -968,6 +1680,7 @@ class CmaKernel(cma.CMAEvolutionStrategy):
         es = super(CmaKernel, self)._copy_light(sigma, inopts)
 
         es.objective_values = self.objective_values
+        es._objective_values_incumbent = self._objective_values_incumbent
         es._last_offspring_f_values = self._last_offspring_f_values
         return es  
     
@@ -976,10 +1689,38 @@ class FitFun:
     Define a callable multiobjective function from single objective ones.
     Example:
         fitness = comocma.FitFun(cma.ff.sphere, lambda x: cma.ff.sphere(x-1)).
+
+    Called with a 2-D array of solutions (one per row), for example all
+    solutions from `Sofomore.ask`, it returns the array of their objective
+    values of shape ``(len(X), len(self.callables))``. With
+    ``vectorized=True``, each single objective is then called only once
+    with the whole array and must return the values of all its rows::
+
+        >>> import numpy as np
+        >>> import comocma
+        >>> fitness = comocma.FitFun(lambda X: np.sum(X**2, axis=1),
+        ...                          lambda X: np.sum((X - 1)**2, axis=1),
+        ...                          vectorized=True)
+        >>> fitness(np.array([[0, 0], [1, 0.]])).tolist()
+        [[0.0, 2.0], [1.0, 1.0]]
+        >>> fitness([1, 0.]).tolist()
+        [1.0, 1.0]
+
     """
-    def __init__(self, *args):
+    def __init__(self, *args, **kwargs):
         self.callables = args
+        self.vectorized = kwargs.pop('vectorized', False)
+        if kwargs:
+            raise TypeError("unexpected keyword arguments: " + ', '.join(kwargs))
     def __call__(self, x):
+        if np.ndim(x) == 2:
+            X = np.asarray(x, dtype=float)
+            if self.vectorized:
+                return np.column_stack([np.asarray(f(X), dtype=float).reshape(len(X))
+                                        for f in self.callables])
+            return np.array([[f(xi) for f in self.callables] for xi in X], dtype=float)
+        if self.vectorized:
+            return self(np.atleast_2d(np.asarray(x, dtype=float)))[0]
         return [f(x) for f in self.callables]
 
 
@@ -1033,5 +1774,5 @@ def sort_odds_even(i):
     """
     return - (i % 2)
 
-
-
+# the keys above which also compute the keys of an array of indices
+_vectorized_sort_keys = (sort_increasing, sort_decreasing, sort_even_odds, sort_odds_even)
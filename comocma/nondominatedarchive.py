@@ -3,7 +3,6 @@
 """
 """
 from .hv import HyperVolume
-import itertools
 
 import numpy as np
 
@@ -279,6 +278,24 @@ class NonDominatedList(list):
                 return True
         return False
 
+    def _strictly_dominated_mask(self, f_tuples):
+        """return a boolean array which is `True` where an element of `self`
+        strictly dominates the respective element of `f_tuples`.
+
+        Same as ``[self._strictly_dominates(f) for f in f_tuples]``.
+
+        >>> from nondominatedarchive import NonDominatedList as NDA
+        >>> a = NDA([[0.39, 0.075], [0.0087, 0.14]])
+        >>> a._strictly_dominated_mask([[1, 1], [0.39, 1], [-1, 33]]).tolist()
+        [True, True, False]
+
+        """
+        f_tuples = np.asarray(f_tuples, dtype=float)
+        if len(self) == 0 or len(f_tuples) == 0:
+            return np.zeros(len(f_tuples), dtype=bool)
+        points = np.asarray(self, dtype=float)
+        return (points[None, :, :] < f_tuples[:, None, :]).all(axis=2).any(axis=1)
+
     def _strictly_dominates_with(self, idx, f_tuple):
         """return `True` if ``self[idx]`` strictly dominates `f_tuple`.
 
@@ -314,11 +331,8 @@ class NonDominatedList(list):
         for point in dominators:
             for i in range(len(f_tuple)):
                 projections_loose += [self._projection(f_tuple, i, point[i])]
-        projections = []
-        for proj in projections_loose:
-            if not self._strictly_dominates(proj):
-                projections += [proj]
-        return projections
+        dominated = self._strictly_dominated_mask(projections_loose)
+        return [proj for proj, d in zip(projections_loose, dominated) if not d]
     
     @property
     def kink_points(self):
@@ -333,14 +347,10 @@ class NonDominatedList(list):
                         " point is needed (for the extremal kink points)")
         if self._kink_points is not None:
             return self._kink_points
-        kinks_loose = []
-        for pair in itertools.combinations(self + [self.reference_point], 2):
-            kinks_loose += [[max(x) for x in zip(pair[0], pair[1])]]
-        kinks = []
-        for kink in kinks_loose:
-            if not self._strictly_dominates(kink):
-                kinks += [kink]
-        self._kink_points = kinks
+        points = np.asarray(self + [self.reference_point], dtype=float)
+        i, j = np.triu_indices(len(points), 1)  # the pairs in `itertools.combinations` order
+        kinks_loose = np.maximum(points[i], points[j])
+        self._kink_points = kinks_loose[~self._strictly_dominated_mask(kinks_loose)].tolist()
         return self._kink_points
         
     @property
@@ -393,14 +403,10 @@ class NonDominatedList(list):
                 return 0
             return sum([max(0, f_tuple[k] - self.reference_point[k])**2
                 for k in range(len(f_tuple)) ])**0.5
-        squared_distances = []
-        for kink in self.kink_points:
-            squared_distances += [sum( (f_tuple[k] - kink[k])**2 for k in range(
-                    len(f_tuple)) )]
-        for proj in self._projection_to_empirical_front(f_tuple):
-            squared_distances += [sum( (f_tuple[k] - proj[k])**2 for k in range(
-                    len(f_tuple)) )]
-        return min(squared_distances)**0.5
+        candidates = np.asarray(self.kink_points +
+                                self._projection_to_empirical_front(f_tuple), dtype=float)
+        return float(np.min(np.sum((candidates - np.asarray(f_tuple, dtype=float))**2,
+                                   axis=1)))**0.5
         
     def hypervolume_improvement(self, f_tuple):
         """return how much `f_tuple` would improve the hypervolume.
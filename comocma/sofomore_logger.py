@@ -4,6 +4,7 @@
 import numpy as np
 import cma
 from cma import interfaces
+from moarchiving import BiobjectiveNondominatedSortedList
 import os
 import matplotlib.pyplot as plt
 import ast
@@ -245,6 +246,7 @@ class SofomoreDataLogger(interfaces.BaseDataLogger):
         in the implemention.
 
         """
+        from .como import _front_2d  # not on module level, `como` imports this module
         mod = modulo if modulo is not None else self.modulo
         self.counter += 1
         if mod == 0 or (self.counter > 3 and (self.counter - 1) % mod):
@@ -267,38 +269,40 @@ class SofomoreDataLogger(interfaces.BaseDataLogger):
 #                                + str(type(es)), 'add', 'CMADataLogger')
         evals = es.countevals
         iteration = es.countiter
-        hypervolume = float(es.pareto_front_cut.hypervolume)
+        hypervolume, len_pareto_front_cut = es._pareto_front_cut_stats()
+        hypervolume = float(hypervolume)
         hypervolume_archive = 0.0
         len_archive = 0
         if es.isarchive:
             hypervolume_archive = float(es.archive.hypervolume)
             len_archive = len(es.archive)
         ratio_inactive = 1 - len(es._active_indices) / len(es)
-        ratio_nondom_incumbent = len(es.pareto_front_cut)/len(es)
+        ratio_nondom_incumbent = len_pareto_front_cut/len(es)
                 
         for i in range(len(es.offspring)):
             idx = es.offspring[i][0]
             kernel = es.kernels[idx]
-            
-            temp_archive = es.NDA(kernel._last_offspring_f_values, es.reference_point)
-            temp_archive.add(kernel.objective_values)
-            es._ratio_nondom_offspring_incumbent[idx] = len(temp_archive) / (
+
+            if es.NDA is BiobjectiveNondominatedSortedList:
+                # count the non-dominated points without creating an archive
+                len_nondom = np.count_nonzero(_front_2d(
+                    kernel._last_offspring_f_values + [kernel.objective_values],
+                    es.reference_point))
+            else:
+                temp_archive = es.NDA(kernel._last_offspring_f_values, es.reference_point)
+                temp_archive.add(kernel.objective_values)
+                len_nondom = len(temp_archive)
+            es._ratio_nondom_offspring_incumbent[idx] = len_nondom / (
                     1 + len(kernel._last_offspring_f_values) )
                 
     
-        first_quartile_ratio_offspring_incumbent = np.percentile(es._ratio_nondom_offspring_incumbent, 25);
-        median_ratio_offspring_incumbent = np.percentile(es._ratio_nondom_offspring_incumbent, 50);
-        last_quartile_ratio_offspring_incumbent = np.percentile(es._ratio_nondom_offspring_incumbent, 75);
+        (first_quartile_ratio_offspring_incumbent, median_ratio_offspring_incumbent,
+         last_quartile_ratio_offspring_incumbent) = np.percentile(
+             es._ratio_nondom_offspring_incumbent, [25, 50, 75])
         
         
-        median_axis_ratios = np.median([kernel.D.max() / kernel.D.min() \
-        if not kernel.opts['CMA_diagonal'] or kernel.countiter > kernel.opts['CMA_diagonal']
-        else max(kernel.sigma_vec*1) / min(kernel.sigma_vec*1) for kernel in es.kernels])
-        median_sigmas = np.median([kernel.sigma for kernel in es.kernels])
-        median_min_stds = np.median([kernel.sigma * min(kernel.sigma_vec * kernel.dC**0.5) \
-                                     for kernel in es.kernels])
-        median_max_stds = np.median([kernel.sigma * max(kernel.sigma_vec * kernel.dC**0.5) \
-                                     for kernel in es.kernels])
+        (median_axis_ratios, median_sigmas, median_min_stds,
+         median_max_stds) = es._median_kernel_stats()
         median_stds = self.es.median_stds
 
         
@@ -419,13 +423,16 @@ class SofomoreDataLogger(interfaces.BaseDataLogger):
                 # line of our file is a headline
                 maxsplit = 2 if filename[-15:] == 'median_stds.dat' else -1
                 newtab = [list(map(ast.literal_eval,line.split(maxsplit = maxsplit))) for line in tab]
-                length = len(newtab[0])
-                for k in range(2, length):
-                    res += [np.array([line[k] for line in newtab])]
-                    
+                if maxsplit == -1:  # only numbers: a single array, of which we take the columns
+                    columns = list(np.array(newtab).T)
+                else:
+                    columns = [np.array([line[k] for line in newtab])
+                               for k in range(len(newtab[0]))]
+                res += columns[2:]
+
                 if i == 0: # we define iteration, countevals just for the first filename
-                    iteration = np.array([line[0] for line in newtab])
-                    countevals = np.array([line[1] for line in newtab])
+                    iteration = columns[0]
+                    countevals = columns[1]
                 
         return iteration, countevals, res
         
@@ -450,12 +457,12 @@ class SofomoreDataLogger(interfaces.BaseDataLogger):
                 pass
         moes = self.es
         try:
-            plt.plot([u[0] for u in moes.archive], [u[1] for u in moes.archive], '.',
-                     label = "archive")
+            archive = np.asarray(moes.archive, dtype=float).reshape(-1, 2)
+            plt.plot(archive[:, 0], archive[:, 1], '.', label = "archive")
         except:
             pass
-        plt.plot([u[0] for u in moes.pareto_front_cut], [u[1] for u in moes.pareto_front_cut], 'o',
-                 label = "cma-es incumbents")
+        front = np.asarray(moes.pareto_front_cut, dtype=float).reshape(-1, 2)
+        plt.plot(front[:, 0], front[:, 1], 'o', label = "cma-es incumbents")
         pass
      #   plt.legend()
     def plot_ratios(self, iabscissa=1):